@@ -103,7 +103,20 @@ NeXosim gRPC simulation server.
         ```
 """
 
-__all__ = ["Simulation", "EventKey", "time", "types", "exceptions"]
+__all__ = [
+    "Simulation",
+    "EventKey",
+    "ScheduleSpec",
+    "make_step_until_request",
+    "time",
+    "types",
+    "exceptions",
+]
 
 from . import exceptions, time, types
-from ._simulation import EventKey, Simulation
+from ._simulation import (
+    EventKey,
+    ScheduleSpec,
+    Simulation,
+    make_step_until_request,
+)
@@ -1,3 +1,96 @@
+import functools
+import io
+
+import cbor2
 from cattrs.preconf.cbor2 import make_converter
 
 cbor2_converter = make_converter()
+
+
+_CBOR_NONE = cbor2_converter.dumps(None)
+
+# Scalar types for which the converter unstructures to the value itself, so
+# that its encoding is identical to a raw cbor2 encoding.
+_PASSTHROUGH_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+
+
+def fast_dumps(obj) -> bytes:
+    """Serializes an object to CBOR, bypassing the converter for scalars.
+
+    `None` and scalar built-ins pass through the cattrs converter unchanged,
+    so its type-hook machinery can be skipped and the raw cbor2 encoder
+    called directly. Containers still go through the converter since their
+    elements may require unstructuring.
+    """
+    if type(obj) in _PASSTHROUGH_TYPES:
+        return cbor2.dumps(obj)
+
+    return cbor2_converter.dumps(obj)
+
+
+# Types whose equality provably implies encoding equality, making their
+# values safe keys for the encoding caches below (the type in the cache key
+# already keeps e.g. `True` and `1` apart). Floats are deliberately absent
+# (`0.0` and `-0.0` compare equal but encode differently), as are containers
+# and user-defined types, whose equality may hold between values with
+# distinct encodings (e.g. `(1,) == (1.0,)`).
+_CACHEABLE_TYPES = frozenset({type(None), bool, int, str, bytes})
+
+
+@functools.lru_cache(maxsize=256)
+def _dumps_cacheable(ty: type, obj) -> bytes:
+    return cbor2_converter.dumps(obj)
+
+
+def cached_dumps(obj) -> bytes:
+    """Serializes an object to CBOR, memoizing the encoding of repeated values.
+
+    Scheduling loops frequently re-submit identical events; payloads whose
+    type guarantees that equal values share an encoding are kept in a small
+    LRU cache keyed on the value and its exact type. All other payloads fall
+    back to a plain encoding: equality of containers and user-defined types
+    does not imply equality of the encodings (e.g. `(1,)` and `(1.0,)`
+    compare equal but encode differently), so caching them could send the
+    wrong bytes.
+    """
+    if obj is None:
+        return _CBOR_NONE
+
+    ty = type(obj)
+    if ty in _CACHEABLE_TYPES:
+        return _dumps_cacheable(ty, obj)
+
+    return cbor2_converter.dumps(obj)
+
+
+def loads_all(frames) -> list:
+    """Decodes an iterable of CBOR-encoded frames into a list of objects.
+
+    CBOR items are self-delimiting (RFC 8949), so the frames are concatenated
+    into a single buffer and decoded in one pass by a shared decoder rather
+    than paying the decoder setup cost once per frame.
+    """
+    data = b"".join(frames)
+    end = len(data)
+    buffer = io.BytesIO(data)
+
+    objs = []
+    append = objs.append
+    decode = cbor2.CBORDecoder(buffer).decode
+    tell = buffer.tell
+    while tell() < end:
+        append(decode())
+
+    return objs
+
+
+def loads_all_as(frames, ty) -> list:
+    """Decodes an iterable of CBOR-encoded frames into objects of type `ty`.
+
+    The converter's structure hook for `ty` is resolved once for the whole
+    batch instead of being dispatched again for every frame, so per-element
+    work reduces to the raw CBOR decode and the structuring call itself.
+    """
+    structure = cbor2_converter.get_structure_hook(ty)
+
+    return [structure(obj, ty) for obj in loads_all(frames)]
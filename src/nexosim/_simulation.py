@@ -1,4 +1,5 @@
-import inspect
+import dataclasses
+import functools
 import json
 import typing
 
@@ -8,7 +9,14 @@ from google.protobuf.duration_pb2 import Duration as PbDuration
 from google.protobuf.timestamp_pb2 import Timestamp as PbTimestamp
 
 from . import exceptions
-from ._config import cbor2_converter
+from ._config import (
+    _CACHEABLE_TYPES,
+    cached_dumps,
+    cbor2_converter,
+    fast_dumps,
+    loads_all,
+    loads_all_as,
+)
 from ._proto import simulation_pb2, simulation_pb2_grpc
 from ._proto.simulation_pb2 import EventKey as PbEventKey
 from .time import Duration, MonotonicTime
@@ -20,6 +28,38 @@ if typing.TYPE_CHECKING:
 else:
     from typing import Type as TypeForm
 
+# Reusable singletons for the empty request messages. gRPC only reads the
+# request when serializing it, so sharing one instance per call site saves a
+# protobuf allocation on every call.
+_TERMINATE_REQUEST = simulation_pb2.TerminateRequest()
+_HALT_REQUEST = simulation_pb2.HaltRequest()
+_SAVE_REQUEST = simulation_pb2.SaveRequest()
+_TIME_REQUEST = simulation_pb2.TimeRequest()
+_STEP_REQUEST = simulation_pb2.StepRequest()
+_RUN_REQUEST = simulation_pb2.RunRequest()
+_LIST_EVENT_SOURCES_REQUEST = simulation_pb2.ListEventSourcesRequest()
+_LIST_QUERY_SOURCES_REQUEST = simulation_pb2.ListQuerySourcesRequest()
+_LIST_EVENT_SINKS_REQUEST = simulation_pb2.ListEventSinksRequest()
+
+# Pre-serialized request bytes for the hottest empty-request RPCs, paired
+# with raw-bytes callables created in the clients' constructors so each call
+# skips the per-call protobuf serialization.
+_STEP_REQUEST_BYTES = _STEP_REQUEST.SerializeToString()
+_TIME_REQUEST_BYTES = _TIME_REQUEST.SerializeToString()
+_STEP_METHOD = "/simulation.v1.Simulation/Step"
+_TIME_METHOD = "/simulation.v1.Simulation/Time"
+_PROCESS_EVENT_METHOD = "/simulation.v1.Simulation/ProcessEvent"
+
+# Default channel arguments shared by the sync and aio clients. Simulation
+# control loops are chatty, with many short unary calls; keepalive pings keep
+# the HTTP/2 connection (and any intermediate NAT/proxy state) hot between
+# calls instead of paying a reconnection on the next request. The one-minute
+# interval stays above the ping rate that strict servers and proxies police
+# (gRPC servers send GOAWAY after two overly eager pings by default); a more
+# aggressive profile for local deployments can be opted into via
+# `channel_options`.
+_DEFAULT_CHANNEL_OPTIONS = (("grpc.keepalive_time_ms", 60000),)
+
 
 class EventKey:
     """A handle to a scheduled event.
@@ -35,6 +75,37 @@ class EventKey:
     _key: PbEventKey
 
 
+@dataclasses.dataclass
+class ScheduleSpec:
+    """The specification of a single event within a batch of scheduled events.
+
+    Instances of this class describe the arguments of an individual
+    [`Simulation.schedule_event`][nexosim.Simulation.schedule_event] call and
+    are meant to be consumed by the
+    [`Simulation.schedule_events`][nexosim.Simulation.schedule_events] method.
+
+    Attributes:
+        deadline: The target time, specified either as an absolute time
+            set in the future of the current simulation time or as a strictly
+            positive duration relative to the current simulation time.
+
+        source: The path of the event source.
+
+        event: an object that can be serialized/deserialized to the expected
+            event type. The `None` default may be used if the Rust event
+            type is `()` or `Option`.
+
+        period: An optional, strictly positive duration expressing the
+            repetition period of the event. If left to `None`, the event is
+            scheduled only once.
+    """
+
+    deadline: MonotonicTime | Duration
+    source: str | typing.Iterable[str]
+    event: object = None
+    period: None | Duration = None
+
+
 class Simulation:
     """A handle to the remote simulation bench.
 
@@ -56,22 +127,57 @@ class Simulation:
 
     Args:
         address: the address at which the NeXosim server is running.
+
+        channel_options: an optional sequence of `(name, value)` gRPC channel
+            arguments appended to (and overriding) the defaults. By default
+            the channel sends HTTP/2 keepalive pings at a conservative
+            one-minute interval while calls are in flight; local or
+            dedicated servers known to tolerate eager pinging can opt into a
+            more aggressive profile, e.g.
+            `(("grpc.keepalive_time_ms", 10000),
+            ("grpc.keepalive_permit_without_calls", 1))`.
     """
 
-    def __init__(self, address: str):
+    def __init__(
+        self,
+        address: str,
+        channel_options: typing.Sequence[tuple[str, typing.Any]] | None = None,
+    ):
+        options = list(_DEFAULT_CHANNEL_OPTIONS)
+
         # Work around gRPC's weird behavior (a.k.a. bug) with Unix Domain
         # Sockets.
         #
         # See https://github.com/grpc/grpc/issues/34305
-        options = (
-            (("grpc.default_authority", "localhost"),)
-            if address.lstrip().startswith("unix:")
-            else None
-        )
+        #
+        # Proxy resolution is also meaningless for a local socket and only
+        # adds avoidable name-resolver work at channel setup.
+        if address.lstrip().startswith("unix:"):
+            options.append(("grpc.default_authority", "localhost"))
+            options.append(("grpc.enable_http_proxy", 0))
+
+        if channel_options is not None:
+            options.extend(channel_options)
 
         self._channel = grpc.insecure_channel(address, options)  # type: ignore
         self._stub = simulation_pb2_grpc.SimulationStub(self._channel)
 
+        # Raw-bytes callables for the hottest empty-request RPCs: the
+        # pre-serialized request bytes are sent as-is, skipping the protobuf
+        # serialization on every call.
+        self._step_call = self._channel.unary_unary(
+            _STEP_METHOD,
+            response_deserializer=simulation_pb2.StepReply.FromString,
+        )
+        self._time_call = self._channel.unary_unary(
+            _TIME_METHOD,
+            response_deserializer=simulation_pb2.TimeReply.FromString,
+        )
+        self._process_event_call = self._channel.unary_unary(
+            _PROCESS_EVENT_METHOD,
+            response_deserializer=simulation_pb2.ProcessEventReply.FromString,
+        )
+
     def __enter__(self) -> typing.Self:
         return self
 
@@ -104,7 +210,7 @@ class Simulation:
                     - [`DuplicateEventSinkError`][nexosim.exceptions.DuplicateEventSinkError]
                     - [`InvalidBenchConfigError`][nexosim.exceptions.InvalidBenchConfigError]
         """
-        request = simulation_pb2.BuildRequest(cfg=cbor2_converter.dumps(cfg))
+        request = simulation_pb2.BuildRequest(cfg=fast_dumps(cfg))
         reply = self._stub.Build(request)
 
         if reply.HasField("error"):
@@ -184,20 +290,19 @@ class Simulation:
         )
         reply = self._stub.InitAndRun(request)
 
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     def terminate(self) -> None:
         """
         Terminates a simulation.
         """
-        request = simulation_pb2.TerminateRequest()
-        reply = self._stub.Terminate(request)
+        reply = self._stub.Terminate(_TERMINATE_REQUEST)
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -230,8 +335,7 @@ class Simulation:
 
                 - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
         """
-        request = simulation_pb2.HaltRequest()
-        reply = self._stub.Halt(request)
+        reply = self._stub.Halt(_HALT_REQUEST)
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -253,13 +357,15 @@ class Simulation:
                 - [`SaveError`][nexosim.exceptions.SaveError]
                 - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
         """
-        request = simulation_pb2.SaveRequest()
-        reply = self._stub.Save(request)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
+        reply = self._stub.Save(_SAVE_REQUEST)
 
-        return reply.state
+        match reply.WhichOneof("result"):
+            case "state":
+                return reply.state
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     def restore(self, state: bytes) -> None:
         """
@@ -335,13 +441,13 @@ class Simulation:
         request = simulation_pb2.RestoreAndRunRequest(state=state)
         reply = self._stub.RestoreAndRun(request)
 
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     def time(self) -> MonotonicTime:
         """Returns the current simulation time.
@@ -357,16 +463,15 @@ class Simulation:
                 - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
         """
 
-        request = simulation_pb2.TimeRequest()
-        reply = self._stub.Time(request)
+        reply = self._time_call(_TIME_REQUEST_BYTES)
 
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     def step(self) -> MonotonicTime:
         """Advances simulation time to that of the next scheduled event,
@@ -394,16 +499,15 @@ class Simulation:
                 - [`SimulationOutOfSyncError`][nexosim.exceptions.SimulationOutOfSyncError]
         """
 
-        request = simulation_pb2.StepRequest()
-        reply = self._stub.Step(request)
-
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
+        reply = self._step_call(_STEP_REQUEST_BYTES)
 
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     def run(self) -> MonotonicTime:
         """Iteratively advances the simulation time until the simulation end, as
@@ -433,18 +537,20 @@ class Simulation:
 
         """
 
-        request = simulation_pb2.RunRequest()
-        reply = self._stub.Run(request)
-
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
+        reply = self._stub.Run(_RUN_REQUEST)
 
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
-    def step_until(self, deadline: MonotonicTime | Duration) -> MonotonicTime:
+    def step_until(
+        self,
+        deadline: MonotonicTime | Duration | simulation_pb2.StepUntilRequest,
+    ) -> MonotonicTime:
         """Iteratively advances the simulation time until the specified
         deadline, as if by calling [Simulation.step][nexosim.Simulation.step]
         repeatedly.
@@ -457,7 +563,10 @@ class Simulation:
         Args:
             deadline: The target time, specified either as an absolute time
                 reference or as a positive duration relative to the current
-                simulation time.
+                simulation time. Alternatively, a request prebuilt with
+                [`make_step_until_request`][nexosim.make_step_until_request]
+                may be passed, which can be hoisted out of tight stepping
+                loops.
 
         Returns:
             The final simulation time.
@@ -478,23 +587,20 @@ class Simulation:
                 - [`SimulationOutOfSyncError`][nexosim.exceptions.SimulationOutOfSyncError]
         """
 
-        kwargs = {}
-
-        if isinstance(deadline, MonotonicTime):
-            kwargs["time"] = PbTimestamp(seconds=deadline.secs, nanos=deadline.nanos)
+        if isinstance(deadline, simulation_pb2.StepUntilRequest):
+            request = deadline
         else:
-            kwargs["duration"] = PbDuration(seconds=deadline.secs, nanos=deadline.nanos)
+            request = make_step_until_request(deadline)
 
-        request = simulation_pb2.StepUntilRequest(**kwargs)  # type: ignore
         reply = self._stub.StepUntil(request)
 
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     def list_event_sources(self) -> list[list[str]]:
         """Lists available event sources.
@@ -509,8 +615,7 @@ class Simulation:
 
                 - [`BenchNotBuiltError`][nexosim.exceptions.BenchNotBuiltError]
         """
-        request = simulation_pb2.ListEventSourcesRequest()
-        reply = self._stub.ListEventSources(request)
+        reply = self._stub.ListEventSources(_LIST_EVENT_SOURCES_REQUEST)
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -575,8 +680,7 @@ class Simulation:
 
                 - [`BenchNotBuiltError`][nexosim.exceptions.BenchNotBuiltError]
         """
-        request = simulation_pb2.ListQuerySourcesRequest()
-        reply = self._stub.ListQuerySources(request)
+        reply = self._stub.ListQuerySources(_LIST_QUERY_SOURCES_REQUEST)
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -643,8 +747,7 @@ class Simulation:
 
                 - [`BenchNotBuiltError`][nexosim.exceptions.BenchNotBuiltError]
         """
-        request = simulation_pb2.ListEventSinksRequest()
-        reply = self._stub.ListEventSinks(request)
+        reply = self._stub.ListEventSinks(_LIST_EVENT_SINKS_REQUEST)
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -735,7 +838,7 @@ class Simulation:
         source = source if not isinstance(source, str) else (source,)
         request = simulation_pb2.InjectEventRequest(
             source=simulation_pb2.Path(segments=source),
-            event=cbor2_converter.dumps(event),
+            event=fast_dumps(event),
         )
         reply = self._stub.InjectEvent(request)
 
@@ -812,38 +915,93 @@ class Simulation:
                 - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
         """
 
-        kwargs = {}
+        request = _schedule_event_request(deadline, source, event, period, with_key)
+        reply = self._stub.ScheduleEvent(request)
 
-        if isinstance(deadline, MonotonicTime):
-            kwargs["time"] = PbTimestamp(seconds=deadline.secs, nanos=deadline.nanos)
-        else:
-            kwargs["duration"] = PbDuration(seconds=deadline.secs, nanos=deadline.nanos)
+        match reply.WhichOneof("result"):
+            case "key":
+                key = EventKey()
+                key._key = reply.key
 
-        source = source if not isinstance(source, str) else (source,)
-        kwargs["source"] = simulation_pb2.Path(segments=source)
+                return key
+            case "error":
+                raise _to_error(reply.error)
 
-        if inspect.isclass(type(event)):
-            event_bytes = cbor2_converter.dumps(event)
-        else:
-            event_bytes = cbor2.dumps(event)
-        kwargs["event"] = event_bytes
+    def schedule_events(self, specs: typing.Iterable[ScheduleSpec]) -> None:
+        """Schedules a batch of events at future times.
 
-        if period is not None:
-            kwargs["period"] = PbDuration(seconds=period.secs, nanos=period.nanos)
+        This is functionally equivalent to calling
+        [`Simulation.schedule_event`][nexosim.Simulation.schedule_event] for
+        each specification, except that all requests are issued before the
+        first reply is awaited. The round-trip latency to the server is
+        therefore paid only once for the whole batch rather than once per
+        event.
+
+        Note that the relative scheduling order of the events within a batch
+        is unspecified. If several events target the same model at the same
+        simulation time and their processing order matters, they should be
+        scheduled with separate
+        [`Simulation.schedule_event`][nexosim.Simulation.schedule_event]
+        calls instead.
 
-        kwargs["with_key"] = with_key
+        Args:
+            specs: The specifications of the events to be scheduled.
 
-        request = simulation_pb2.ScheduleEventRequest(**kwargs)
-        reply = self._stub.ScheduleEvent(request)
+        Raises:
+            exceptions.SimulationError: One of the exceptions derived from
+                [`SimulationError`][nexosim.exceptions.SimulationError] may be
+                raised, such as:
+
+                - [`InvalidDeadlineError`][nexosim.exceptions.InvalidDeadlineError]
+                - [`InvalidPeriodError`][nexosim.exceptions.InvalidPeriodError]
+                - [`EventSourceNotFoundError`][nexosim.exceptions.EventSourceNotFoundError]
+                - [`InvalidEventTypeError`][nexosim.exceptions.InvalidEventTypeError]
+                - [`InvalidMessageError`][nexosim.exceptions.InvalidMessageError]
+                - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
+        """
 
-        if reply.HasField("key"):
-            key = EventKey()
-            key._key = reply.key
+        futures = [
+            self._stub.ScheduleEvent.future(
+                _schedule_event_request(
+                    spec.deadline, spec.source, spec.event, spec.period, False
+                )
+            )
+            for spec in specs
+        ]
 
-            return key
+        for future in futures:
+            reply = future.result()
 
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
+            if reply.HasField("error"):
+                raise _to_error(reply.error)
+
+    def step_after(self, specs: typing.Iterable[ScheduleSpec]) -> MonotonicTime:
+        """Schedules a batch of events and advances the simulation time to
+        that of the next scheduled event.
+
+        This is functionally equivalent to calling
+        [`Simulation.schedule_events`][nexosim.Simulation.schedule_events]
+        followed by [`Simulation.step`][nexosim.Simulation.step], and is a
+        convenience for the common schedule-then-step control-loop pattern:
+        the server round-trip is paid twice per iteration instead of once per
+        scheduled event.
+
+        Args:
+            specs: The specifications of the events to be scheduled.
+
+        Returns:
+            The final simulation time.
+
+        Raises:
+            exceptions.SimulationError: Any of the exceptions raised by
+                [`Simulation.schedule_events`][nexosim.Simulation.schedule_events]
+                and [`Simulation.step`][nexosim.Simulation.step] may be
+                raised.
+        """
+
+        self.schedule_events(specs)
+
+        return self.step()
 
     def cancel_event(self, key: EventKey) -> None:
         """Cancels a previously schedule event.
@@ -897,16 +1055,55 @@ class Simulation:
                 - [`SimulationPanicError`][nexosim.exceptions.SimulationPanicError]
                 - [`SimulationTimeoutError`][nexosim.exceptions.SimulationTimeoutError]
         """
-        source = source if not isinstance(source, str) else (source,)
-        request = simulation_pb2.ProcessEventRequest(
-            source=simulation_pb2.Path(segments=source),
-            event=cbor2_converter.dumps(event),
-        )
-        reply = self._stub.ProcessEvent(request)
+        source = (source,) if isinstance(source, str) else tuple(source)
+        reply = self._process_event_call(_process_event_bytes(source, event))
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
 
+    def process_events(
+        self, events: typing.Iterable[tuple[str | typing.Iterable[str], typing.Any]]
+    ) -> None:
+        """Broadcasts a batch of events from event sources immediately,
+        blocking until all of them have completed.
+
+        This is functionally equivalent to calling
+        [`Simulation.process_event`][nexosim.Simulation.process_event] for
+        each `(source, event)` pair, except that all requests are issued
+        before the first reply is awaited, so the server round-trip is paid
+        only once for the whole batch.
+
+        Note that the relative processing order of the events within a batch
+        is unspecified; events whose processing order matters should be
+        submitted with separate
+        [`Simulation.process_event`][nexosim.Simulation.process_event] calls
+        instead.
+
+        Args:
+            events: `(source, event)` pairs, where `source` is the path of
+                the event source and `event` an object that can be
+                serialized/deserialized to the expected event type.
+
+        Raises:
+            exceptions.SimulationError: One of the exceptions raised by
+                [`Simulation.process_event`][nexosim.Simulation.process_event]
+                may be raised.
+        """
+        futures = [
+            self._process_event_call.future(
+                _process_event_bytes(
+                    (source,) if isinstance(source, str) else tuple(source), event
+                )
+            )
+            for source, event in events
+        ]
+
+        for future in futures:
+            reply = future.result()
+
+            if reply.HasField("error"):
+                raise _to_error(reply.error)
+
     def process_query(
         self,
         source: str | typing.Iterable[str],
@@ -953,7 +1150,7 @@ class Simulation:
         source = source if not isinstance(source, str) else (source,)
         request = simulation_pb2.ProcessQueryRequest(
             source=simulation_pb2.Path(segments=source),
-            request=cbor2_converter.dumps(request),
+            request=fast_dumps(request),
         )
         reply = self._stub.ProcessQuery(request)
 
@@ -961,9 +1158,9 @@ class Simulation:
             raise _to_error(reply.error)
 
         if reply_type is object:
-            return [cbor2.loads(r) for r in reply.replies]
+            return loads_all(reply.replies)
         else:
-            return [cbor2_converter.loads(r, reply_type) for r in reply.replies]  # type: ignore
+            return loads_all_as(reply.replies, reply_type)  # type: ignore
 
     def try_read_events(
         self, sink: str | typing.Iterable[str], event_type: TypeForm[T] = object
@@ -1004,9 +1201,82 @@ class Simulation:
             raise _to_error(reply.error)
 
         if event_type is object:
-            return [cbor2.loads(reply) for reply in reply.events]
+            return loads_all(reply.events)
         else:
-            return [cbor2_converter.loads(r, event_type) for r in reply.events]  # type: ignore
+            return loads_all_as(reply.events, event_type)  # type: ignore
+
+    def try_read_events_multi(
+        self,
+        sinks: typing.Iterable[str | typing.Iterable[str]],
+        event_type: TypeForm[T] = object,
+    ) -> dict[str | tuple[str, ...], list[T]]:
+        """Reads all events from several event sinks.
+
+        This is functionally equivalent to calling
+        [`Simulation.try_read_events`][nexosim.Simulation.try_read_events]
+        for each sink, except that all requests are issued before the first
+        reply is awaited, so the server round-trip is paid only once for the
+        whole batch.
+
+        Args:
+            sinks: The paths of the event sinks. Each sink may appear only
+                once: reads drain their sink, so a repeated sink in a batch
+                would silently discard the events drained by its first read.
+
+            event_type: The Python type to which events should be mapped. If
+                left unspecified, events are mapped to their canonical
+                representation in terms of built-in Python types such as `bool`,
+                `int`, `float`, `str`, `bytes`, `dict` and `list`.
+
+        Returns:
+            A mapping of the sinks (with non-string paths normalized to
+            tuples) to their ordered lists of events.
+
+        Raises:
+            ValueError: If the same sink appears more than once.
+
+            exceptions.SimulationError: One of the exceptions derived from
+                [`SimulationError`][nexosim.exceptions.SimulationError] may be
+                raised, such as:
+
+                - [`InvalidMessageError`][nexosim.exceptions.InvalidMessageError]
+                - [`SinkNotFoundError`][nexosim.exceptions.SinkNotFoundError]
+                - [`SinkTerminatedError`][nexosim.exceptions.SinkTerminatedError]
+                - [`SinkReadRaceError`][nexosim.exceptions.SinkReadRaceError]
+                - [`SinkReadTimeoutError`][nexosim.exceptions.SinkReadTimeoutError]
+                - [`InvalidEventTypeError`][nexosim.exceptions.InvalidEventTypeError]
+                - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
+        """
+        sinks = [sink if isinstance(sink, str) else tuple(sink) for sink in sinks]
+
+        # Compare on the wire path so that e.g. "sink" and ("sink",) count as
+        # the same sink.
+        paths = [(sink,) if isinstance(sink, str) else sink for sink in sinks]
+        if len(set(paths)) != len(paths):
+            raise ValueError("each sink may only be read once per batch")
+
+        futures = [
+            self._stub.TryReadEvents.future(
+                simulation_pb2.TryReadEventsRequest(
+                    sink=simulation_pb2.Path(segments=path)
+                )
+            )
+            for path in paths
+        ]
+
+        events = {}
+        for sink, future in zip(sinks, futures, strict=True):
+            reply = future.result()
+
+            if reply.HasField("error"):
+                raise _to_error(reply.error)
+
+            if event_type is object:
+                events[sink] = loads_all(reply.events)
+            else:
+                events[sink] = loads_all_as(reply.events, event_type)
+
+        return events
 
     def read_event(
         self,
@@ -1115,6 +1385,98 @@ class Simulation:
             raise _to_error(reply.error)
 
 
+# Per-type deadline encoders, so that hot scheduling loops pay a single dict
+# lookup rather than an isinstance chain per call.
+_DEADLINE_ENCODERS: dict[type, typing.Callable[[typing.Any], dict[str, typing.Any]]] = {
+    MonotonicTime: lambda deadline: {
+        "time": PbTimestamp(seconds=deadline.secs, nanos=deadline.nanos)
+    },
+    Duration: lambda deadline: {
+        "duration": PbDuration(seconds=deadline.secs, nanos=deadline.nanos)
+    },
+}
+
+
+def _deadline_kwargs(deadline: MonotonicTime | Duration) -> dict[str, typing.Any]:
+    try:
+        encoder = _DEADLINE_ENCODERS[type(deadline)]
+    except KeyError:
+        # Tolerate subclasses of the deadline types.
+        encoder = _DEADLINE_ENCODERS[
+            MonotonicTime if isinstance(deadline, MonotonicTime) else Duration
+        ]
+
+    return encoder(deadline)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_process_event_bytes(
+    source: tuple[str, ...], ty: type, event: typing.Any
+) -> bytes:
+    return simulation_pb2.ProcessEventRequest(
+        source=simulation_pb2.Path(segments=source),
+        event=fast_dumps(event),
+    ).SerializeToString()
+
+
+def _process_event_bytes(source: tuple[str, ...], event: typing.Any) -> bytes:
+    """Serializes a ProcessEventRequest to wire bytes, memoizing repeated
+    `(source, event)` pairs for the payload types that are safe to cache by
+    value (see `_CACHEABLE_TYPES` in `_config`)."""
+    if type(event) in _CACHEABLE_TYPES:
+        return _cached_process_event_bytes(source, type(event), event)
+
+    return simulation_pb2.ProcessEventRequest(
+        source=simulation_pb2.Path(segments=source),
+        event=fast_dumps(event),
+    ).SerializeToString()
+
+
+def make_step_until_request(
+    deadline: MonotonicTime | Duration,
+) -> simulation_pb2.StepUntilRequest:
+    """Builds a reusable request for
+    [`Simulation.step_until`][nexosim.Simulation.step_until].
+
+    Control loops that repeatedly step by the same relative deadline can
+    hoist the request construction out of the loop and pass the prebuilt
+    request directly to
+    [`Simulation.step_until`][nexosim.Simulation.step_until], skipping a
+    protobuf allocation per iteration.
+
+    Args:
+        deadline: The target time, specified either as an absolute time
+            reference or as a positive duration relative to the current
+            simulation time.
+
+    Returns:
+        The corresponding request message.
+    """
+    return simulation_pb2.StepUntilRequest(**_deadline_kwargs(deadline))  # type: ignore
+
+
+def _schedule_event_request(
+    deadline: MonotonicTime | Duration,
+    source: str | typing.Iterable[str],
+    event: object,
+    period: None | Duration,
+    with_key: bool,
+) -> simulation_pb2.ScheduleEventRequest:
+    kwargs = _deadline_kwargs(deadline)
+
+    source = source if not isinstance(source, str) else (source,)
+    kwargs["source"] = simulation_pb2.Path(segments=source)
+
+    kwargs["event"] = cached_dumps(event)
+
+    if period is not None:
+        kwargs["period"] = PbDuration(seconds=period.secs, nanos=period.nanos)
+
+    kwargs["with_key"] = with_key
+
+    return simulation_pb2.ScheduleEventRequest(**kwargs)
+
+
 def _to_error(error: simulation_pb2.Error) -> exceptions.SimulationError:
     match error.code:
         # Generic errors.
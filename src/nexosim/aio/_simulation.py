@@ -1,4 +1,5 @@
-import inspect
+import asyncio
+import itertools
 import json
 import typing
 
@@ -8,9 +9,29 @@ from google.protobuf.timestamp_pb2 import Timestamp as PbTimestamp
 from grpc import aio  # type: ignore
 
 from .. import exceptions
-from .._config import cbor2_converter
+from .._config import cbor2_converter, fast_dumps, loads_all, loads_all_as
 from .._proto import simulation_pb2, simulation_pb2_grpc
-from .._simulation import EventKey, _to_error
+from .._simulation import (
+    _DEFAULT_CHANNEL_OPTIONS,
+    _HALT_REQUEST,
+    _LIST_EVENT_SINKS_REQUEST,
+    _LIST_EVENT_SOURCES_REQUEST,
+    _LIST_QUERY_SOURCES_REQUEST,
+    _PROCESS_EVENT_METHOD,
+    _RUN_REQUEST,
+    _SAVE_REQUEST,
+    _STEP_METHOD,
+    _STEP_REQUEST_BYTES,
+    _TERMINATE_REQUEST,
+    _TIME_METHOD,
+    _TIME_REQUEST_BYTES,
+    EventKey,
+    ScheduleSpec,
+    _process_event_bytes,
+    _schedule_event_request,
+    _to_error,
+    make_step_until_request,
+)
 from ..time import Duration, MonotonicTime
 
 T = typing.TypeVar("T")
@@ -46,21 +67,91 @@ class Simulation:
 
     Args:
         address: the address at which the NeXosim server is running.
+
+        channels: the number of gRPC channels opened to the server. A single
+            HTTP/2 connection is typically limited to about 100 concurrent
+            streams, so workloads issuing many concurrent read requests may
+            benefit from a small pool of channels. Read-only requests
+            ([`Simulation.time`][nexosim.aio.Simulation.time],
+            [`Simulation.try_read_events`][nexosim.aio.Simulation.try_read_events]
+            and [`Simulation.read_event`][nexosim.aio.Simulation.read_event])
+            are distributed round-robin over the pool while all other
+            requests are pinned to the first channel.
+
+        channel_options: an optional sequence of `(name, value)` gRPC channel
+            arguments appended to (and overriding) the defaults. By default
+            the channels send HTTP/2 keepalive pings at a conservative
+            one-minute interval while calls are in flight; local or
+            dedicated servers known to tolerate eager pinging can opt into a
+            more aggressive profile, e.g.
+            `(("grpc.keepalive_time_ms", 10000),
+            ("grpc.keepalive_permit_without_calls", 1))`.
     """
 
-    def __init__(self, address: str):
+    def __init__(
+        self,
+        address: str,
+        channels: int = 1,
+        channel_options: typing.Sequence[tuple[str, typing.Any]] | None = None,
+    ):
+        if channels < 1:
+            raise ValueError("at least one channel is required")
+
+        options = list(_DEFAULT_CHANNEL_OPTIONS)
+
         # Work around gRPC's weird behavior (a.k.a. bug) with Unix Domain
         # Sockets.
         #
         # See https://github.com/grpc/grpc/issues/34305
-        options = (
-            (("grpc.default_authority", "localhost"),)
-            if address.lstrip().startswith("unix:")
-            else None
+        #
+        # Proxy resolution is also meaningless for a local socket and only
+        # adds avoidable name-resolver work at channel setup.
+        if address.lstrip().startswith("unix:"):
+            options.append(("grpc.default_authority", "localhost"))
+            options.append(("grpc.enable_http_proxy", 0))
+
+        if channels > 1:
+            # Without a local sub-channel pool, gRPC folds channels with
+            # identical arguments onto the same connection, defeating the
+            # purpose of the pool.
+            options.append(("grpc.use_local_subchannel_pool", 1))
+
+        if channel_options is not None:
+            options.extend(channel_options)
+
+        self._channels = [
+            aio.insecure_channel(address, options) for _ in range(channels)
+        ]
+        self._channel = self._channels[0]
+        self._stub = simulation_pb2_grpc.SimulationStub(self._channel)
+        self._read_stubs = itertools.cycle(
+            [self._stub]
+            + [
+                simulation_pb2_grpc.SimulationStub(channel)
+                for channel in self._channels[1:]
+            ]
         )
 
-        self._channel = aio.insecure_channel(address, options)
-        self._stub = simulation_pb2_grpc.SimulationStub(self._channel)
+        # Raw-bytes callables for the hottest empty-request RPCs: the
+        # pre-serialized request bytes are sent as-is, skipping the protobuf
+        # serialization on every call. Time follows the read round-robin.
+        self._step_call = self._channel.unary_unary(
+            _STEP_METHOD,
+            response_deserializer=simulation_pb2.StepReply.FromString,
+        )
+        self._time_calls = itertools.cycle(
+            [
+                channel.unary_unary(
+                    _TIME_METHOD,
+                    response_deserializer=simulation_pb2.TimeReply.FromString,
+                )
+                for channel in self._channels
+            ]
+        )
+        self._process_event_call = self._channel.unary_unary(
+            _PROCESS_EVENT_METHOD,
+            response_deserializer=simulation_pb2.ProcessEventReply.FromString,
+        )
 
     async def __aenter__(self) -> typing.Self:
         return self
@@ -69,8 +160,9 @@ class Simulation:
         await self.aclose()
 
     async def aclose(self) -> None:
-        """Closes the gRPC channel."""
-        await self._channel.close()
+        """Closes the gRPC channels."""
+        for channel in self._channels:
+            await channel.close()
 
     async def build(self, cfg: typing.Any = None) -> None:
         """
@@ -94,7 +186,7 @@ class Simulation:
                     - [`DuplicateEventSinkError`][nexosim.exceptions.DuplicateEventSinkError]
                     - [`InvalidBenchConfigError`][nexosim.exceptions.InvalidBenchConfigError]
         """
-        request = simulation_pb2.BuildRequest(cfg=cbor2_converter.dumps(cfg))
+        request = simulation_pb2.BuildRequest(cfg=fast_dumps(cfg))
         reply = await self._stub.Build(request)  # type: ignore
 
         if reply.HasField("error"):
@@ -175,20 +267,19 @@ class Simulation:
         )
         reply = await self._stub.InitAndRun(request)  # type: ignore
 
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     async def terminate(self) -> None:
         """
         Terminates a simulation.
         """
-        request = simulation_pb2.TerminateRequest()
-        reply = await self._stub.Terminate(request)  # type: ignore
+        reply = await self._stub.Terminate(_TERMINATE_REQUEST)  # type: ignore
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -221,8 +312,7 @@ class Simulation:
 
                 - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
         """
-        request = simulation_pb2.HaltRequest()
-        reply = await self._stub.Halt(request)  # type: ignore
+        reply = await self._stub.Halt(_HALT_REQUEST)  # type: ignore
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -245,13 +335,15 @@ class Simulation:
                 - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
 
         """
-        request = simulation_pb2.SaveRequest()
-        reply = await self._stub.Save(request)  # type: ignore
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
+        reply = await self._stub.Save(_SAVE_REQUEST)  # type: ignore
 
-        return reply.state
+        match reply.WhichOneof("result"):
+            case "state":
+                return reply.state
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     async def restore(self, state: bytes) -> None:
         """
@@ -327,13 +419,13 @@ class Simulation:
         request = simulation_pb2.RestoreAndRunRequest(state=state)
         reply = await self._stub.RestoreAndRun(request)  # type: ignore
 
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     async def time(self) -> MonotonicTime:
         """Returns the current simulation time.
@@ -349,16 +441,15 @@ class Simulation:
             - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
         """
 
-        request = simulation_pb2.TimeRequest()
-        reply = await self._stub.Time(request)  # type: ignore
+        reply = await next(self._time_calls)(_TIME_REQUEST_BYTES)
 
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     async def step(self) -> MonotonicTime:
         """Advances simulation time to that of the next scheduled event,
@@ -386,15 +477,14 @@ class Simulation:
                 - [`SimulationOutOfSyncError`][nexosim.exceptions.SimulationOutOfSyncError]
         """
 
-        request = simulation_pb2.StepRequest()
-        reply = await self._stub.Step(request)  # type: ignore
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        reply = await self._step_call(_STEP_REQUEST_BYTES)
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     async def run(self) -> MonotonicTime:
         """Iteratively advances the simulation time until the simulation end, as
@@ -425,18 +515,20 @@ class Simulation:
 
         """
 
-        request = simulation_pb2.RunRequest()
-        reply = await self._stub.Run(request)  # type: ignore
+        reply = await self._stub.Run(_RUN_REQUEST)  # type: ignore
 
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
-
-    async def step_until(self, deadline: MonotonicTime | Duration) -> MonotonicTime:
+    async def step_until(
+        self,
+        deadline: MonotonicTime | Duration | simulation_pb2.StepUntilRequest,
+    ) -> MonotonicTime:
         """Iteratively advances the simulation time until the specified
         deadline, as if by calling [Simulation.step][nexosim.aio.Simulation.step]
         repeatedly.
@@ -450,7 +542,10 @@ class Simulation:
         Args:
             deadline: The target time, specified either as an absolute time
                 reference or as a positive duration relative to the current
-                simulation time.
+                simulation time. Alternatively, a request prebuilt with
+                [`make_step_until_request`][nexosim.make_step_until_request]
+                may be passed, which can be hoisted out of tight stepping
+                loops.
 
         Returns:
             The final simulation time.
@@ -471,23 +566,19 @@ class Simulation:
                 - [`SimulationOutOfSyncError`][nexosim.exceptions.SimulationOutOfSyncError]
         """
 
-        kwargs = {}
-
-        if isinstance(deadline, MonotonicTime):
-            kwargs["time"] = PbTimestamp(seconds=deadline.secs, nanos=deadline.nanos)
+        if isinstance(deadline, simulation_pb2.StepUntilRequest):
+            request = deadline
         else:
-            kwargs["duration"] = PbDuration(seconds=deadline.secs, nanos=deadline.nanos)
-
-        request = simulation_pb2.StepUntilRequest(**kwargs)  # type: ignore
+            request = make_step_until_request(deadline)
 
         reply = await self._stub.StepUntil(request)  # type: ignore
-        if reply.HasField("time"):
-            return MonotonicTime(reply.time.seconds, reply.time.nanos)
-
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
-
-        raise exceptions.UnexpectedError("unexpected response")
+        match reply.WhichOneof("result"):
+            case "time":
+                return MonotonicTime(reply.time.seconds, reply.time.nanos)
+            case "error":
+                raise _to_error(reply.error)
+            case _:
+                raise exceptions.UnexpectedError("unexpected response")
 
     async def list_event_sources(self) -> list[list[str]]:
         """Lists available event sources.
@@ -506,8 +597,7 @@ class Simulation:
 
                 - [`BenchNotBuiltError`][nexosim.exceptions.BenchNotBuiltError]
         """
-        request = simulation_pb2.ListEventSourcesRequest()
-        reply = await self._stub.ListEventSources(request)  # type: ignore
+        reply = await self._stub.ListEventSources(_LIST_EVENT_SOURCES_REQUEST)  # type: ignore
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -572,8 +662,7 @@ class Simulation:
 
                 - [`BenchNotBuiltError`][nexosim.exceptions.BenchNotBuiltError]
         """
-        request = simulation_pb2.ListQuerySourcesRequest()
-        reply = await self._stub.ListQuerySources(request)  # type: ignore
+        reply = await self._stub.ListQuerySources(_LIST_QUERY_SOURCES_REQUEST)  # type: ignore
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -640,8 +729,7 @@ class Simulation:
 
                 - [`BenchNotBuiltError`][nexosim.exceptions.BenchNotBuiltError]
         """
-        request = simulation_pb2.ListEventSinksRequest()
-        reply = await self._stub.ListEventSinks(request)  # type: ignore
+        reply = await self._stub.ListEventSinks(_LIST_EVENT_SINKS_REQUEST)  # type: ignore
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
@@ -732,7 +820,7 @@ class Simulation:
         source = source if not isinstance(source, str) else (source,)
         request = simulation_pb2.InjectEventRequest(
             source=simulation_pb2.Path(segments=source),
-            event=cbor2_converter.dumps(event),
+            event=fast_dumps(event),
         )
         reply = await self._stub.InjectEvent(request)  # type: ignore
 
@@ -809,39 +897,93 @@ class Simulation:
                 - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
         """
 
-        kwargs = {}
+        request = _schedule_event_request(deadline, source, event, period, with_key)
 
-        if isinstance(deadline, MonotonicTime):
-            kwargs["time"] = PbTimestamp(seconds=deadline.secs, nanos=deadline.nanos)
-        else:
-            kwargs["duration"] = PbDuration(seconds=deadline.secs, nanos=deadline.nanos)
+        reply = await self._stub.ScheduleEvent(request)  # type: ignore
 
-        source = source if not isinstance(source, str) else (source,)
-        kwargs["source"] = simulation_pb2.Path(segments=source)
+        match reply.WhichOneof("result"):
+            case "key":
+                key = EventKey()
+                key._key = reply.key
 
-        if inspect.isclass(type(event)):
-            event_bytes = cbor2_converter.dumps(event)
-        else:
-            event_bytes = cbor2.dumps(event)
-        kwargs["event"] = event_bytes
+                return key
+            case "error":
+                raise _to_error(reply.error)
 
-        if period is not None:
-            kwargs["period"] = PbDuration(seconds=period.secs, nanos=period.nanos)
+    async def schedule_events(self, specs: typing.Iterable[ScheduleSpec]) -> None:
+        """Schedules a batch of events at future times.
 
-        kwargs["with_key"] = with_key
+        This is functionally equivalent to calling
+        [`Simulation.schedule_event`][nexosim.aio.Simulation.schedule_event]
+        for each specification, except that all requests are issued
+        concurrently. The round-trip latency to the server is therefore paid
+        only once for the whole batch rather than once per event.
+
+        Note that the relative scheduling order of the events within a batch
+        is unspecified. If several events target the same model at the same
+        simulation time and their processing order matters, they should be
+        scheduled with separate
+        [`Simulation.schedule_event`][nexosim.aio.Simulation.schedule_event]
+        calls instead.
 
-        request = simulation_pb2.ScheduleEventRequest(**kwargs)
+        Args:
+            specs: The specifications of the events to be scheduled.
 
-        reply = await self._stub.ScheduleEvent(request)  # type: ignore
+        Raises:
+            exceptions.SimulationError: One of the exceptions derived from
+                [`SimulationError`][nexosim.exceptions.SimulationError] may be
+                raised, such as:
 
-        if reply.HasField("key"):
-            key = EventKey()
-            key._key = reply.key
+                - [`InvalidDeadlineError`][nexosim.exceptions.InvalidDeadlineError]
+                - [`InvalidPeriodError`][nexosim.exceptions.InvalidPeriodError]
+                - [`EventSourceNotFoundError`][nexosim.exceptions.EventSourceNotFoundError]
+                - [`InvalidEventTypeError`][nexosim.exceptions.InvalidEventTypeError]
+                - [`InvalidMessageError`][nexosim.exceptions.InvalidMessageError]
+                - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
+        """
 
-            return key
+        requests = [
+            _schedule_event_request(
+                spec.deadline, spec.source, spec.event, spec.period, False
+            )
+            for spec in specs
+        ]
 
-        if reply.HasField("error"):
-            raise _to_error(reply.error)
+        replies = await asyncio.gather(
+            *(self._stub.ScheduleEvent(request) for request in requests)  # type: ignore
+        )
+
+        for reply in replies:
+            if reply.HasField("error"):
+                raise _to_error(reply.error)
+
+    async def step_after(self, specs: typing.Iterable[ScheduleSpec]) -> MonotonicTime:
+        """Schedules a batch of events and advances the simulation time to
+        that of the next scheduled event.
+
+        This is functionally equivalent to calling
+        [`Simulation.schedule_events`][nexosim.aio.Simulation.schedule_events]
+        followed by [`Simulation.step`][nexosim.aio.Simulation.step], and is a
+        convenience for the common schedule-then-step control-loop pattern:
+        the server round-trip is paid twice per iteration instead of once per
+        scheduled event.
+
+        Args:
+            specs: The specifications of the events to be scheduled.
+
+        Returns:
+            The final simulation time.
+
+        Raises:
+            exceptions.SimulationError: Any of the exceptions raised by
+                [`Simulation.schedule_events`][nexosim.aio.Simulation.schedule_events]
+                and [`Simulation.step`][nexosim.aio.Simulation.step] may be
+                raised.
+        """
+
+        await self.schedule_events(specs)
+
+        return await self.step()
 
     async def cancel_event(self, key: EventKey) -> None:
         """Cancels a previously schedule event.
@@ -895,15 +1037,54 @@ class Simulation:
                 - [`SimulationPanicError`][nexosim.exceptions.SimulationPanicError]
                 - [`SimulationTimeoutError`][nexosim.exceptions.SimulationTimeoutError]
         """
-        source = source if not isinstance(source, str) else (source,)
-        request = simulation_pb2.ProcessEventRequest(
-            source=simulation_pb2.Path(segments=source),
-            event=cbor2_converter.dumps(event),
-        )
-        reply = await self._stub.ProcessEvent(request)  # type: ignore
+        source = (source,) if isinstance(source, str) else tuple(source)
+        reply = await self._process_event_call(_process_event_bytes(source, event))
         if reply.HasField("error"):
             raise _to_error(reply.error)
 
+    async def process_events(
+        self, events: typing.Iterable[tuple[str | typing.Iterable[str], typing.Any]]
+    ) -> None:
+        """Broadcasts a batch of events from event sources immediately,
+        blocking until all of them have completed.
+
+        This is functionally equivalent to calling
+        [`Simulation.process_event`][nexosim.aio.Simulation.process_event]
+        for each `(source, event)` pair, except that all requests are issued
+        concurrently, so the server round-trip is paid only once for the
+        whole batch.
+
+        Note that the relative processing order of the events within a batch
+        is unspecified; events whose processing order matters should be
+        submitted with separate
+        [`Simulation.process_event`][nexosim.aio.Simulation.process_event]
+        calls instead.
+
+        Args:
+            events: `(source, event)` pairs, where `source` is the path of
+                the event source and `event` an object that can be
+                serialized/deserialized to the expected event type.
+
+        Raises:
+            exceptions.SimulationError: One of the exceptions raised by
+                [`Simulation.process_event`][nexosim.aio.Simulation.process_event]
+                may be raised.
+        """
+        requests = [
+            _process_event_bytes(
+                (source,) if isinstance(source, str) else tuple(source), event
+            )
+            for source, event in events
+        ]
+
+        replies = await asyncio.gather(
+            *(self._process_event_call(request) for request in requests)
+        )
+
+        for reply in replies:
+            if reply.HasField("error"):
+                raise _to_error(reply.error)
+
     async def process_query(
         self,
         source: str | typing.Iterable[str],
@@ -950,7 +1131,7 @@ class Simulation:
         source = source if not isinstance(source, str) else (source,)
         request = simulation_pb2.ProcessQueryRequest(
             source=simulation_pb2.Path(segments=source),
-            request=cbor2_converter.dumps(request),
+            request=fast_dumps(request),
         )
         reply = await self._stub.ProcessQuery(request)  # type: ignore
 
@@ -958,9 +1139,9 @@ class Simulation:
             raise _to_error(reply.error)
 
         if reply_type is object:
-            return [cbor2.loads(r) for r in reply.replies]
+            return loads_all(reply.replies)
         else:
-            return [cbor2_converter.loads(r, reply_type) for r in reply.replies]  # type: ignore
+            return loads_all_as(reply.replies, reply_type)  # type: ignore
 
     async def try_read_events(
         self, sink: str | typing.Iterable[str], event_type: TypeForm[T] = object
@@ -995,15 +1176,70 @@ class Simulation:
         request = simulation_pb2.TryReadEventsRequest(
             sink=simulation_pb2.Path(segments=sink)
         )
-        reply = await self._stub.TryReadEvents(request)  # type: ignore
+        reply = await next(self._read_stubs).TryReadEvents(request)  # type: ignore
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
 
         if event_type is object:
-            return [cbor2.loads(reply) for reply in reply.events]
+            return loads_all(reply.events)
         else:
-            return [cbor2_converter.loads(r, event_type) for r in reply.events]  # type: ignore
+            return loads_all_as(reply.events, event_type)  # type: ignore
+
+    async def try_read_events_multi(
+        self,
+        sinks: typing.Iterable[str | typing.Iterable[str]],
+        event_type: TypeForm[T] = object,
+    ) -> dict[str | tuple[str, ...], list[T]]:
+        """Reads all events from several event sinks.
+
+        This is functionally equivalent to calling
+        [`Simulation.try_read_events`][nexosim.aio.Simulation.try_read_events]
+        for each sink, except that all requests are issued concurrently, so
+        the server round-trip is paid only once for the whole batch.
+
+        Args:
+            sinks: The paths of the event sinks. Each sink may appear only
+                once: reads drain their sink, so a repeated sink in a batch
+                would silently discard the events drained by its first read.
+
+            event_type: The Python type to which events should be mapped. If
+                left unspecified, events are mapped to their canonical
+                representation in terms of built-in Python types such as `bool`,
+                `int`, `float`, `str`, `bytes`, `dict` and `list`.
+
+        Returns:
+            A mapping of the sinks (with non-string paths normalized to
+            tuples) to their ordered lists of events.
+
+        Raises:
+            ValueError: If the same sink appears more than once.
+
+            exceptions.SimulationError: One of the exceptions derived from
+                [`SimulationError`][nexosim.exceptions.SimulationError] may be
+                raised, such as:
+
+                - [`InvalidMessageError`][nexosim.exceptions.InvalidMessageError]
+                - [`SinkNotFoundError`][nexosim.exceptions.SinkNotFoundError]
+                - [`SinkTerminatedError`][nexosim.exceptions.SinkTerminatedError]
+                - [`SinkReadRaceError`][nexosim.exceptions.SinkReadRaceError]
+                - [`SinkReadTimeoutError`][nexosim.exceptions.SinkReadTimeoutError]
+                - [`InvalidEventTypeError`][nexosim.exceptions.InvalidEventTypeError]
+                - [`SimulationNotStartedError`][nexosim.exceptions.SimulationNotStartedError]
+        """
+        sinks = [sink if isinstance(sink, str) else tuple(sink) for sink in sinks]
+
+        # Compare on the wire path so that e.g. "sink" and ("sink",) count as
+        # the same sink.
+        paths = [(sink,) if isinstance(sink, str) else sink for sink in sinks]
+        if len(set(paths)) != len(paths):
+            raise ValueError("each sink may only be read once per batch")
+
+        events = await asyncio.gather(
+            *(self.try_read_events(sink, event_type) for sink in sinks)
+        )
+
+        return dict(zip(sinks, events, strict=True))
 
     async def read_event(
         self,
@@ -1045,7 +1281,7 @@ class Simulation:
             sink=simulation_pb2.Path(segments=sink),
             timeout=PbDuration(seconds=timeout.secs, nanos=timeout.nanos),
         )
-        reply = await self._stub.ReadEvent(request)  # type: ignore
+        reply = await next(self._read_stubs).ReadEvent(request)  # type: ignore
 
         if reply.HasField("error"):
             raise _to_error(reply.error)
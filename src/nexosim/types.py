@@ -209,6 +209,7 @@ def my_enum_discriminant(my_enum: MyEnum.type) -> int:
 """
 
 import dataclasses
+import functools
 import inspect
 import typing
 
@@ -275,11 +276,18 @@ def enumclass(cls: type[_T]) -> type[_T]:
     else:
         setattr(cls, "type", ty)
 
-    # This avoids the variant's hook being overwritten by the enum hook
-    # in single variant enums
-    structure_func = _cbor2_converter.structure
+    # Cache of per-variant structure hooks, so that decode dispatch costs a
+    # couple of dict lookups instead of a full converter dispatch per event.
+    # Hooks are resolved lazily on first use so that hooks registered after
+    # the decorator runs are still picked up.
+    variant_hooks: dict[str, typing.Callable[[typing.Any, typing.Any], typing.Any]] = {}
+
+    # The hook of a single variant enum must be resolved eagerly: it would
+    # otherwise be overwritten by the enum hook, which is registered for the
+    # same type.
     if typing.get_origin(ty) is not typing.Union:
-        structure_func = _cbor2_converter.get_structure_hook(ty)
+        ((name, variant_ty),) = variants.items()
+        variant_hooks[name] = _cbor2_converter.get_structure_hook(variant_ty)
 
     # Custom deserialization hook.
     def structure_enum_hook(d: typing.Any, t: object):  # type: ignore
@@ -301,13 +309,20 @@ def enumclass(cls: type[_T]) -> type[_T]:
             ty_unstruct = None
 
         try:
-            ty = variants[ty_name]
+            variant_ty = variants[ty_name]
         except KeyError as err:
             raise ValueError(
                 "could not match unstructured data to a valid enum variant"
             ) from err
 
-        return structure_func(ty_unstruct, ty)
+        try:
+            hook = variant_hooks[ty_name]
+        except KeyError:
+            hook = variant_hooks[ty_name] = _cbor2_converter.get_structure_hook(
+                variant_ty
+            )
+
+        return hook(ty_unstruct, variant_ty)
 
     _cbor2_converter.register_structure_hook(ty, structure_enum_hook)
 
@@ -377,6 +392,25 @@ def tupleclass(cls: typing.Type[_T]) -> typing.Type[_T]:
     cls = dataclasses.dataclass(cls)
     setattr(cls, "_tuple_type", None)
 
+    # Specialize __eq__ to the exact field layout. The dataclass-generated
+    # implementation builds and compares a tuple of all fields per side; for
+    # the small payloads typical of tuple-like events this costs more than
+    # the field comparisons themselves.
+    field_names = [field.name for field in dataclasses.fields(cls)]  # type: ignore
+    comparisons = (
+        " and ".join("self.{0} == other.{0}".format(name) for name in field_names)
+        or "True"
+    )
+    namespace: dict[str, typing.Any] = {}
+    exec(
+        "def __eq__(self, other):\n"
+        "    if other.__class__ is self.__class__:\n"
+        f"        return {comparisons}\n"
+        "    return NotImplemented\n",
+        namespace,
+    )
+    setattr(cls, "__eq__", namespace["__eq__"])
+
     # Register the serialization hook.
     _cbor2_converter.register_unstructure_hook(cls, _tuple_unstructure_hook)
 
@@ -417,6 +451,17 @@ class UnitType:
     def __repr__(self):
         return self.__class__.__qualname__
 
+    # Unit types carry no state, so instances of the same class compare equal
+    # with a single class-identity check.
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return True
+
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.__class__)
+
 
 _cbor2_converter.register_structure_hook(UnitType, lambda d, t: t())
 _cbor2_converter.register_unstructure_hook(UnitType, _unit_unstructure_hook)
@@ -1032,6 +1077,7 @@ def tuple_type(
 ]: ...
 
 
+@functools.lru_cache(maxsize=None)
 def tuple_type(*args):  # type: ignore
     """A convenient type constructor for tuple-like types.
 
@@ -1040,6 +1086,10 @@ def tuple_type(*args):  # type: ignore
     of the components as arguments and is overloaded by arity to return the
     appropriate `TupleType*Arg` class.
 
+    The returned parametrized classes are memoized, so repeated calls with the
+    same component types (e.g. from modules imported by many test files) do
+    not re-run the generic parametrization machinery.
+
     Warning:
         Note that not all type checkers support dynamically generated base
         classes and it may be necessary to manally specify the appropriate
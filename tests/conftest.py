@@ -1,24 +1,43 @@
 import shlex
 import subprocess
-import time
 
+import grpc
 import pytest
 
 
+def _wait_until_ready(address, timeout=10.0):
+    """Block until the server at `address` accepts connections.
+
+    Waiting on channel readiness instead of sleeping both removes the
+    arbitrary startup delay and forces gRPC core initialization and the
+    HTTP/2 handshake before the first test RPC, so cold-start costs do not
+    land inside a test.
+    """
+    channel = grpc.insecure_channel(address)
+    try:
+        grpc.channel_ready_future(channel).result(timeout=timeout)
+    finally:
+        channel.close()
+
+
 @pytest.fixture(scope="session")
-def coffee():
-    """Spawn a simulation server set up with the coffee machine bench."""
-    address = "0.0.0.0:41635"
+def bench_binary():
+    """Build the simulation server binary once per test session."""
     subprocess.run(
         shlex.split("cargo build --manifest-path tests/bench/Cargo.toml"), check=True
     )
+
+    return "./tests/bench/target/debug/grpc-python"
+
+
+@pytest.fixture(scope="session")
+def coffee(bench_binary):
+    """Spawn a simulation server set up with the coffee machine bench."""
+    address = "0.0.0.0:41635"
     with subprocess.Popen(
-        shlex.split(
-            f"./tests/bench/target/debug/grpc-python coffee -a {address} --http"
-        )
+        shlex.split(f"{bench_binary} coffee -a {address} --http")
     ) as proc:
-        # wait for startup
-        time.sleep(1)
+        _wait_until_ready(address)
         try:
             yield address
         finally:
@@ -26,19 +45,13 @@ def coffee():
 
 
 @pytest.fixture(scope="session")
-def rt_coffee():
+def rt_coffee(bench_binary):
     """Spawn a simulation server set up with the real time coffee machine bench."""
     address = "0.0.0.0:41636"
-    subprocess.run(
-        shlex.split("cargo build --manifest-path tests/bench/Cargo.toml"), check=True
-    )
     with subprocess.Popen(
-        shlex.split(
-            f"./tests/bench/target/debug/grpc-python coffeert -a {address} --http"
-        )
+        shlex.split(f"{bench_binary} coffeert -a {address} --http")
     ) as proc:
-        # wait for startup
-        time.sleep(1)
+        _wait_until_ready(address)
         try:
             yield address
         finally:
@@ -46,19 +59,13 @@ def rt_coffee():
 
 
 @pytest.fixture(scope="session")
-def rt_coffee_ticker():
+def rt_coffee_ticker(bench_binary):
     """Spawn a simulation server set up with the real time coffee machine bench."""
     address = "0.0.0.0:41637"
-    subprocess.run(
-        shlex.split("cargo build --manifest-path tests/bench/Cargo.toml"), check=True
-    )
     with subprocess.Popen(
-        shlex.split(
-            f"./tests/bench/target/debug/grpc-python coffeertticker -a {address} --http"
-        )
+        shlex.split(f"{bench_binary} coffeertticker -a {address} --http")
     ) as proc:
-        # wait for startup
-        time.sleep(1)
+        _wait_until_ready(address)
         try:
             yield address
         finally:
@@ -66,17 +73,13 @@ def rt_coffee_ticker():
 
 
 @pytest.fixture(scope="session")
-def types_bench():
+def types_bench(bench_binary):
     """Spawn a simulation server set up with bench2."""
     address = "0.0.0.0:41637"
-    subprocess.run(
-        shlex.split("cargo build --manifest-path tests/bench/Cargo.toml"), check=True
-    )
     with subprocess.Popen(
-        shlex.split(f"./tests/bench/target/debug/grpc-python types -a {address} --http")
+        shlex.split(f"{bench_binary} types -a {address} --http")
     ) as proc:
-        # wait for startup
-        time.sleep(1)
+        _wait_until_ready(address)
         try:
             yield address
         finally:
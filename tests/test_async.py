@@ -3,8 +3,13 @@ import asyncio
 import pytest
 import pytest_asyncio
 
+from nexosim import ScheduleSpec, make_step_until_request
 from nexosim.aio import Simulation
-from nexosim.exceptions import BenchNotBuiltError, SimulationNotStartedError
+from nexosim.exceptions import (
+    BenchNotBuiltError,
+    EventSourceNotFoundError,
+    SimulationNotStartedError,
+)
 from nexosim.time import Duration, MonotonicTime
 
 
@@ -38,7 +43,9 @@ async def test_concurrent_event_and_read(rt_coffee):
     async def main_test():
         await observe_brewing()
 
-        await asyncio.gather(monitor_water(), monitor_commands())
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(monitor_water())
+            tg.create_task(monitor_commands())
 
         assert (await simu.try_read_events("latest_pump_cmd")) == ["Off"]
 
@@ -125,6 +132,17 @@ async def test_step_until_duration(sim):
     assert await sim.time() == MonotonicTime(2, 0)
 
 
+@pytest.mark.asyncio
+async def test_step_until_prebuilt_request(sim):
+    request = make_step_until_request(Duration(1))
+
+    assert await sim.step_until(request) == MonotonicTime(1)
+    assert await sim.step_until(request) == MonotonicTime(2)
+    assert await sim.step_until(
+        make_step_until_request(MonotonicTime(3))
+    ) == MonotonicTime(3)
+
+
 @pytest.mark.asyncio
 async def test_schedule_event_relative_time(sim):
     await sim.step_until(MonotonicTime(1))
@@ -134,6 +152,40 @@ async def test_schedule_event_relative_time(sim):
     assert await sim.time() == MonotonicTime(2)
 
 
+@pytest.mark.asyncio
+async def test_schedule_events(sim):
+    await sim.schedule_events(
+        [
+            ScheduleSpec(MonotonicTime(1), "brew_cmd"),
+            ScheduleSpec(MonotonicTime(2), "brew_cmd"),
+        ]
+    )
+    await sim.step()
+    await sim.step()
+
+    assert await sim.time() == MonotonicTime(2)
+    assert await sim.try_read_events("flow_rate") == [4.5e-6, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_step_after(sim):
+    t = await sim.step_after(
+        [
+            ScheduleSpec(MonotonicTime(1), "brew_cmd"),
+            ScheduleSpec(MonotonicTime(2), "brew_cmd"),
+        ]
+    )
+
+    assert t == MonotonicTime(1)
+    assert await sim.try_read_events("flow_rate") == [4.5e-6]
+
+
+@pytest.mark.asyncio
+async def test_schedule_events_source_not_found(sim):
+    with pytest.raises(EventSourceNotFoundError):
+        await sim.schedule_events([ScheduleSpec(MonotonicTime(1), "no_such_source")])
+
+
 @pytest.mark.asyncio
 async def test_schedule_event_period(sim):
     await sim.schedule_event(
@@ -184,6 +236,47 @@ async def test_read_event_as_str(sim):
     assert await sim.try_read_events("flow_rate", str) == ["4.5e-06"]
 
 
+@pytest.mark.asyncio
+async def test_process_events(sim):
+    await sim.process_events([("brew_cmd", None), ("brew_cmd", None)])
+
+    assert await sim.try_read_events("flow_rate") == [4.5e-6, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_try_read_events_multi(sim):
+    await sim.process_event("brew_cmd")
+
+    events = await sim.try_read_events_multi(["flow_rate", "pump_cmd"])
+
+    assert events == {"flow_rate": [4.5e-6], "pump_cmd": ["On"]}
+
+
+@pytest.mark.asyncio
+async def test_try_read_events_multi_duplicate_sink(sim):
+    with pytest.raises(ValueError):
+        await sim.try_read_events_multi(["flow_rate", ("flow_rate",)])
+
+
+@pytest.mark.asyncio
+async def test_channel_pool(coffee):
+    async with Simulation(coffee, channels=2) as sim:
+        await sim.build()
+        await sim.init()
+        await sim.process_event("brew_cmd")
+
+        # Enough read-only calls to cycle through every pooled channel.
+        assert await sim.time() == MonotonicTime(0, 0)
+        assert await sim.time() == MonotonicTime(0, 0)
+        assert await sim.try_read_events("flow_rate") == [4.5e-6]
+        assert await sim.try_read_events("flow_rate") == []
+
+
+def test_channel_pool_requires_a_channel():
+    with pytest.raises(ValueError):
+        Simulation("localhost:41633", channels=0)
+
+
 @pytest.mark.asyncio
 async def test_run(sim):
     for i in range(1, 11):
@@ -1,7 +1,11 @@
 import pytest
 
-from nexosim import Simulation
-from nexosim.exceptions import BenchNotBuiltError, SimulationNotStartedError
+from nexosim import ScheduleSpec, Simulation, make_step_until_request
+from nexosim.exceptions import (
+    BenchNotBuiltError,
+    EventSourceNotFoundError,
+    SimulationNotStartedError,
+)
 from nexosim.time import Duration, MonotonicTime
 
 
@@ -60,6 +64,14 @@ def test_step_until_duration(sim):
     assert sim.time() == MonotonicTime(2, 0)
 
 
+def test_step_until_prebuilt_request(sim):
+    request = make_step_until_request(Duration(1))
+
+    assert sim.step_until(request) == MonotonicTime(1)
+    assert sim.step_until(request) == MonotonicTime(2)
+    assert sim.step_until(make_step_until_request(MonotonicTime(3))) == MonotonicTime(3)
+
+
 def test_schedule_event_relative_time(sim):
     sim.step_until(MonotonicTime(1))
     sim.schedule_event(Duration(1), "brew_cmd")
@@ -68,6 +80,37 @@ def test_schedule_event_relative_time(sim):
     assert sim.time() == MonotonicTime(2)
 
 
+def test_schedule_events(sim):
+    sim.schedule_events(
+        [
+            ScheduleSpec(MonotonicTime(1), "brew_cmd"),
+            ScheduleSpec(MonotonicTime(2), "brew_cmd"),
+        ]
+    )
+    sim.step()
+    sim.step()
+
+    assert sim.time() == MonotonicTime(2)
+    assert sim.try_read_events("flow_rate") == [4.5e-6, 0.0]
+
+
+def test_step_after(sim):
+    t = sim.step_after(
+        [
+            ScheduleSpec(MonotonicTime(1), "brew_cmd"),
+            ScheduleSpec(MonotonicTime(2), "brew_cmd"),
+        ]
+    )
+
+    assert t == MonotonicTime(1)
+    assert sim.try_read_events("flow_rate") == [4.5e-6]
+
+
+def test_schedule_events_source_not_found(sim):
+    with pytest.raises(EventSourceNotFoundError):
+        sim.schedule_events([ScheduleSpec(MonotonicTime(1), "no_such_source")])
+
+
 def test_schedule_event_period(sim):
     sim.schedule_event(MonotonicTime(1), "brew_time", Duration(1), period=Duration(1))
     for _ in range(10):
@@ -109,6 +152,25 @@ def test_read_event_as_str(sim):
     assert sim.try_read_events("flow_rate", str) == ["4.5e-06"]
 
 
+def test_process_events(sim):
+    sim.process_events([("brew_cmd", None), ("brew_cmd", None)])
+
+    assert sim.try_read_events("flow_rate") == [4.5e-6, 0.0]
+
+
+def test_try_read_events_multi(sim):
+    sim.process_event("brew_cmd")
+
+    events = sim.try_read_events_multi(["flow_rate", "pump_cmd"])
+
+    assert events == {"flow_rate": [4.5e-6], "pump_cmd": ["On"]}
+
+
+def test_try_read_events_multi_duplicate_sink(sim):
+    with pytest.raises(ValueError):
+        sim.try_read_events_multi(["flow_rate", ("flow_rate",)])
+
+
 def test_run(sim):
     for i in range(1, 11):
         sim.schedule_event(MonotonicTime(i), "brew_cmd")